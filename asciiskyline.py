@@ -5,9 +5,11 @@ Creates a little starry city skyline in your terminal, just because it's nice to
 Original author: whelk, who couldn't sleep on the night of 2025-05-16
 """
 
-import curses, os, random
+import curses, os, random, signal
 from curses import wrapper
 
+import skylineframe
+
 screen = curses.initscr()
 screen.nodelay(True)
 
@@ -55,6 +57,7 @@ class Skyline:
     stars = []
     star_rate = 4
     star_chars = ["*"] * 1 + ["."] * 6 + ["+"] * 3
+    star_colors = [1] * 3 + [2] * 6 + [3] * 2
     star_max = int((cols * rows) / 50)
 
     buildings = []
@@ -84,10 +87,167 @@ class Skyline:
     raindrops = []
     raindrop_rate = 4
 
+    # set ASCIISKYLINE_SEED to get the same skyline/effects every run
+    seed = os.environ.get("ASCIISKYLINE_SEED")
+
+    # set ASCIISKYLINE_FRAME to a file path (e.g. /dev/shm/asciiskyline.frame)
+    # to share the current frame with other processes, see skylineframe.py
+    frame_path = os.environ.get("ASCIISKYLINE_FRAME")
+    frame = None
+
 
 skyline = Skyline()
 
 
+def makeAliasTable(values):
+    # build a Vose alias table from a list of (possibly repeated) values, so
+    # weighted picks cost one uniform sample instead of a list lookup/copy
+    outcomes = []
+    weights = []
+    for value in values:
+        if value in outcomes:
+            weights[outcomes.index(value)] += 1
+        else:
+            outcomes.append(value)
+            weights.append(1)
+
+    count = len(outcomes)
+    scaled = [weight * count / len(values) for weight in weights]
+    prob = [1.0] * count
+    alias = list(range(count))
+    small = [i for i, p in enumerate(scaled) if p < 1]
+    large = [i for i, p in enumerate(scaled) if p >= 1]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1 - scaled[less]
+        if scaled[more] < 1:
+            small.append(more)
+        else:
+            large.append(more)
+
+    return outcomes, prob, alias
+
+
+class RandomStream:
+
+    # central source of randomness for all the effect loops.  Single picks go
+    # straight to the generator; bulk pulls (e.g. a whole row of rain) are
+    # generated a block at a time and handed out from a buffer
+
+    block_size = 4096
+
+    def __init__(self, seed=None):
+        self.generator = random.Random(seed)
+        self.uniform = self.generator.random
+        self.buffer = []
+        self.index = 0
+
+    def refill(self):
+        draw = self.uniform
+        self.buffer = [draw() for _ in range(self.block_size)]
+        self.index = 0
+
+    def uniforms(self, count):
+        samples = []
+        while count > 0:
+            if self.index >= len(self.buffer):
+                self.refill()
+            take = min(count, len(self.buffer) - self.index)
+            samples += self.buffer[self.index : self.index + take]
+            self.index += take
+            count -= take
+        return samples
+
+    def randrange(self, stop):
+        return int(self.uniform() * stop)
+
+    def toInt(self, sample, low, high):
+        # turn a uniform sample (e.g. from uniforms()) into a randint() result
+        return low + int(sample * (high - low + 1))
+
+    def randint(self, low, high):
+        return low + int(self.uniform() * (high - low + 1))
+
+    def choice(self, choices, exclude=None):
+        # exclude: index to skip, without copying the list to remove it
+        if exclude is None or len(choices) < 2:
+            return choices[int(self.uniform() * len(choices))]
+        pick = int(self.uniform() * (len(choices) - 1))
+        if pick >= exclude:
+            pick += 1
+        return choices[pick]
+
+    def weightedPicker(self, values):
+        # returns a function picking from values (repeats = weight) via an
+        # alias table, with everything it needs bound locally
+        outcomes, prob, alias = makeAliasTable(values)
+        count = len(outcomes)
+        uniform = self.uniform
+
+        def pick():
+            scaled = uniform() * count
+            index = int(scaled)
+            if scaled - index >= prob[index]:
+                index = alias[index]
+            return outcomes[index]
+
+        return pick
+
+
+def parseSeed(seed):
+    # integer seeds as-is, anything else is used as a string seed (which is
+    # just as reproducible)
+    if not seed:
+        return None
+    try:
+        return int(seed)
+    except ValueError:
+        return seed
+
+
+rng = RandomStream(parseSeed(skyline.seed))
+pickStarChar = rng.weightedPicker(skyline.star_chars)
+pickStarColor = rng.weightedPicker(skyline.star_colors)
+
+
+class ExportingScreen:
+
+    # stands in for the curses screen, mirroring everything drawn into the
+    # shared frame buffer as well
+
+    def __init__(self, window, frame):
+        self.window = window
+        self.frame = frame
+
+    def addstr(self, y, x, text, attr=0):
+        self.frame.put(y, x, text, curses.pair_number(attr))
+        self.window.addstr(y, x, text, attr)
+
+    def __getattr__(self, name):
+        return getattr(self.window, name)
+
+
+if skyline.frame_path:
+    try:
+        skyline.frame = skylineframe.FrameWriter(
+            skyline.frame_path, skyline.rows, skyline.cols
+        )
+    except OSError as error:
+        curses.endwin()
+        exit(f"Can't create frame file {skyline.frame_path}: {error}")
+    screen = ExportingScreen(screen, skyline.frame)
+
+    # exit normally on kill/terminal hangup so the frame file gets cleaned up
+    def quitOnSignal(signum, frame):
+        exit()
+
+    signal.signal(signal.SIGTERM, quitOnSignal)
+    signal.signal(signal.SIGHUP, quitOnSignal)
+
+
 def behindBuilding(position_x, position_y):
     for building in skyline.buildings:
         if position_x in range(
@@ -127,20 +287,20 @@ def drawSym(x, y, symbol, color=None, background=True):
 
 
 def makeBuilding(position_x):
-    window_choices = skyline.office_chars + []
     prev = None
+    prev_window = None
     if skyline.buildings:
         prev = skyline.buildings[-1]
-        window_choices.remove(prev["window"])
-    window = random.choice(window_choices)
-    building_width = random.choice([8, 10, 12, 14])
-    building_height = random.choice([4, 6, 8, 10, 12, 14])
+        prev_window = skyline.office_chars.index(prev["window"])
+    window = rng.choice(skyline.office_chars, exclude=prev_window)
+    building_width = rng.choice([8, 10, 12, 14])
+    building_height = rng.choice([4, 6, 8, 10, 12, 14])
     if prev and building_height in range(prev["height"] - 2, prev["height"] + 2):
-        building_height = random.choice([building_height + 2, building_height + 6])
+        building_height = rng.choice([building_height + 2, building_height + 6])
     cur_width = 0
     cur_height = 0
 
-    unlit_min = max(1, int(building_height / random.randint(1, 4)))
+    unlit_min = max(1, int(building_height / rng.randint(1, 4)))
     building = {
         "position_x": position_x,
         "height": building_height,
@@ -210,11 +370,11 @@ setupSkyline()
 
 
 def starLoop():
-    starchar = random.choice(skyline.star_chars)
-    nstar_x = random.choice(range(skyline.cols))
+    starchar = pickStarChar()
+    nstar_x = rng.randrange(skyline.cols)
     if nstar_x >= skyline.cols:
         nstar_x -= 1
-    nstar_y = skyline.rows - random.choice(range(skyline.rows)) - 1
+    nstar_y = skyline.rows - rng.randrange(skyline.rows) - 1
     coords = [nstar_x, nstar_y]
 
     # add a star
@@ -226,7 +386,7 @@ def starLoop():
     ):
         skyline.stars.append(coords)
         try:
-            star_color = random.choice([1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3])
+            star_color = pickStarColor()
             screen.addstr(nstar_y, nstar_x, starchar, curses.color_pair(star_color))
         except:
             print(f"{nstar_x=} {nstar_y=}")
@@ -234,7 +394,7 @@ def starLoop():
 
     # remove a star
     if len(skyline.stars) >= skyline.star_max:
-        poofstar = random.choice(skyline.stars)
+        poofstar = rng.choice(skyline.stars)
         screen.addstr(poofstar[1], poofstar[0], " ")
         skyline.stars.remove(poofstar)
 
@@ -246,11 +406,8 @@ def officeLoop():
         if len(building["offices_unlit"]) > building["unlit_min"]:
 
             # Try to avoid re-lighting the offices that just went dark
-            office_choices = building["offices_unlit"] + []
-            if len(office_choices) > 1:
-                office_choices.remove(office_choices[-1])
-
-            unlit = random.choice(office_choices)
+            office_choices = building["offices_unlit"]
+            unlit = rng.choice(office_choices, exclude=len(office_choices) - 1)
             try:
                 screen.addstr(
                     skyline.rows - unlit[1],
@@ -263,8 +420,8 @@ def officeLoop():
             except:
                 pass
 
-        elif building["offices_lit"] and random.randint(1, 100) > 98:
-            poofwindow = random.choice(building["offices_lit"])
+        elif building["offices_lit"] and rng.randint(1, 100) > 98:
+            poofwindow = rng.choice(building["offices_lit"])
             screen.addstr(
                 skyline.rows - poofwindow[1],
                 building["position_x"] + poofwindow[0],
@@ -343,17 +500,16 @@ def displayMessage(message, msgtype="default", x=0, y=0, duration=0):
 
 def spawnFirework(x=0, y=0, color=None):
     if not color:
-        colorchoice = list(firework_colors)
-
         # avoid same color firework twice in a row
-        if skyline.fireworks:
-            colorchoice.remove(skyline.fireworks[-1]["color"])
+        prev_color = None
+        if skyline.fireworks and skyline.fireworks[-1]["color"] in firework_colors:
+            prev_color = firework_colors.index(skyline.fireworks[-1]["color"])
 
-        color = random.choice(colorchoice)
+        color = rng.choice(firework_colors, exclude=prev_color)
 
     if not x and not y:
-        x = random.randint(1, skyline.cols)
-        y = skyline.rows - (random.randint(skyline.flasher_position[1], skyline.rows))
+        x = rng.randint(1, skyline.cols)
+        y = skyline.rows - (rng.randint(skyline.flasher_position[1], skyline.rows))
 
     skyline.fireworks.append(
         {
@@ -543,18 +699,24 @@ def rainLoop():
         raindrop_y = 0 if skyline.rows % 2 else 1  # avoid window collisions
 
         # produce raindrops across top of screen
+        # (random samples for the whole row/column are pulled in one go)
+        samples = rng.uniforms(skyline.cols)
         for col in range(skyline.cols):
             last_drop -= 1
-            if last_drop <= 0 and random.randint(1, duration_max) > raindrop_chance:
+            if (
+                last_drop <= 0
+                and rng.toInt(samples[col], 1, duration_max) > raindrop_chance
+            ):
                 raindrop = {"x": col, "y": raindrop_y}
                 skyline.raindrops.append(raindrop)
                 last_drop = 20
 
         # produce raindrops along left side so there's not a bare patch there
         # (since they're moving slightly to the right as they fall)
+        samples = rng.uniforms(skyline.rows)
         for row in range(skyline.rows):
             last_drop -= 1
-            if last_drop <= 0 and random.randint(1, 1000) > raindrop_chance:
+            if last_drop <= 0 and rng.toInt(samples[row], 1, 1000) > raindrop_chance:
                 raindrop_y = row
                 # fixes window collisions for odd-height screen
                 if raindrop_y % 2 and skyline.rows % 2:
@@ -632,6 +794,8 @@ def main(screen):
         displayMessageLoop()
 
         screen.refresh()
+        if skyline.frame:
+            skyline.frame.publish()
         curses.napms(skyline.speed)
         if skyline.tick > 999:
             skyline.tick = 0
@@ -681,6 +845,8 @@ def main(screen):
         elif key in [82, curses.KEY_RESIZE]:
             screen.clear()
             skyline.rows, skyline.cols = screen.getmaxyx()
+            if skyline.frame:
+                skyline.frame.resize(skyline.rows, skyline.cols)
             setupSkyline()
             msg = "Skyline reset."
             if key == curses.KEY_RESIZE:
@@ -721,4 +887,9 @@ def main(screen):
     #####
 
 
-wrapper(main)
+try:
+    wrapper(main)
+finally:
+    # don't leave a stale frame behind for readers
+    if skyline.frame:
+        skyline.frame.close()
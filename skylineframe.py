@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+Shared-memory frame buffer for asciiskyline.  When asciiskyline is started with ASCIISKYLINE_FRAME set to a file path (e.g. /dev/shm/asciiskyline.frame for POSIX shared memory), the composed frame is kept in that memory-mapped file and updated in place each tick, so other local processes (status bars, screenshot tools) can read it without talking to the terminal.
+
+Layout (little-endian):
+    header: magic b"ASKY", version (uint32), rows (uint32), cols (uint32), writer pid (uint64), sequence (uint64)
+    cells:  rows * cols cells, row by row, each glyph codepoint (uint32) + curses color pair number (uint32)
+
+Cells are drawn straight into the map, wrapping onto the next row at the right edge the same way curses does.  The sequence number goes odd at the first cell drawn in a tick and back to even when the tick's frame is complete, so a reader that sees the same even number before and after copying the cells got a consistent frame.  asciiskyline removes the file when it exits (including on SIGTERM/SIGHUP), and readFrame() also checks that the writer pid is still running, so a frame left behind by a killed process isn't mistaken for a live one.  Run this file directly to print the current frame.
+"""
+
+import mmap, os, struct, sys, time
+
+MAGIC = b"ASKY"
+VERSION = 2
+HEADER = struct.Struct("<4sIIIQQ")
+SEQUENCE = struct.Struct("<Q")
+SEQUENCE_OFFSET = HEADER.size - SEQUENCE.size
+CELL = struct.Struct("<II")
+BLANK = CELL.pack(ord(" "), 0)
+
+
+class FrameWriter:
+
+    def __init__(self, path, rows, cols):
+        self.path = path
+        self.map = None
+        self.sequence = 0
+        self.resize(rows, cols)
+
+    def resize(self, rows, cols):
+        # a fresh, fully written file is swapped in rather than truncating the
+        # current one, so readers that still have the old size mapped don't
+        # crash and readers opening the new one never see it half set up
+        self.rows, self.cols = rows, cols
+        if self.sequence % 2:
+            # the new file starts out as a complete (blank) frame
+            self.sequence += 1
+        size = HEADER.size + rows * cols * CELL.size
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w+b") as frame_file:
+            frame_file.truncate(size)
+            frame_map = mmap.mmap(frame_file.fileno(), size)
+        HEADER.pack_into(
+            frame_map, 0, MAGIC, VERSION, rows, cols, os.getpid(), self.sequence
+        )
+        frame_map[HEADER.size :] = BLANK * (rows * cols)
+        os.replace(tmp_path, self.path)
+
+        if self.map:
+            self.map.close()
+        self.map = frame_map
+        self.writing = False
+
+    def put(self, y, x, text, pair=0):
+        # like curses addstr(): text past the right edge wraps onto the next
+        # row, and stops at the bottom-right corner
+        if y < 0 or y >= self.rows or x < 0 or x >= self.cols:
+            return
+        if not self.writing:
+            # mark the frame as being written until publish()
+            self.sequence += 1
+            SEQUENCE.pack_into(self.map, SEQUENCE_OFFSET, self.sequence)
+            self.writing = True
+        cell = y * self.cols + x
+        for char in text[: self.rows * self.cols - cell]:
+            CELL.pack_into(self.map, HEADER.size + cell * CELL.size, ord(char), pair)
+            cell += 1
+
+    def publish(self):
+        # mark this tick's frame as complete
+        if not self.writing:
+            return
+        self.sequence += 1
+        SEQUENCE.pack_into(self.map, SEQUENCE_OFFSET, self.sequence)
+        self.writing = False
+
+    def close(self):
+        # remove the file so readers can't mistake the last frame for a live one
+        if self.map:
+            self.map.close()
+            self.map = None
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def writerRunning(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # running, just as another user
+        pass
+    return True
+
+
+def readFrame(path, timeout=1.0):
+    """
+    Read a consistent frame from path.  Returns a dict with "sequence", "rows", "cols" and "cells" (a list of rows, each a list of (glyph, color pair) tuples), or None if no consistent frame could be read within timeout seconds.  Raises ValueError if path isn't an asciiskyline frame or the asciiskyline that wrote it is no longer running.
+    """
+    not_frame = ValueError(f"{path} is not an asciiskyline frame")
+    with open(path, "rb") as frame_file:
+        if os.fstat(frame_file.fileno()).st_size < HEADER.size:
+            raise not_frame
+        frame_map = mmap.mmap(frame_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        magic, version, rows, cols, pid, _ = HEADER.unpack_from(frame_map, 0)
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or len(frame_map) != HEADER.size + rows * cols * CELL.size
+        ):
+            raise not_frame
+        if not writerRunning(pid):
+            raise ValueError(
+                f"{path} is stale: asciiskyline (pid {pid}) is no longer running"
+            )
+
+        deadline = time.monotonic() + timeout
+        while True:
+            before = SEQUENCE.unpack_from(frame_map, SEQUENCE_OFFSET)[0]
+            if not before % 2:
+                cells = frame_map[HEADER.size :]
+                after = SEQUENCE.unpack_from(frame_map, SEQUENCE_OFFSET)[0]
+                if before == after:
+                    break
+            if time.monotonic() >= deadline:
+                return None
+            # give the writer a moment to finish the frame
+            time.sleep(0.001)
+
+        cells = [(chr(glyph), pair) for glyph, pair in CELL.iter_unpack(cells)]
+        return {
+            "sequence": before,
+            "rows": rows,
+            "cols": cols,
+            "cells": [cells[row * cols : (row + 1) * cols] for row in range(rows)],
+        }
+    finally:
+        frame_map.close()
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else os.environ.get("ASCIISKYLINE_FRAME")
+    if not path:
+        exit(f"usage: {sys.argv[0]} <frame file> (or set ASCIISKYLINE_FRAME)")
+    try:
+        frame = readFrame(path)
+    except (OSError, ValueError) as error:
+        exit(error)
+    if not frame:
+        exit("Couldn't read a consistent frame, try again.")
+    for row in frame["cells"]:
+        print("".join(glyph for glyph, pair in row))